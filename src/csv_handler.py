@@ -1,12 +1,13 @@
 """CSV input/output handling for Anki card generation."""
 
 import csv
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class InputWord:
     """Input word from CSV file."""
 
@@ -42,6 +43,20 @@ class AnkiCard:
             "Example": self.example,
         }
 
+    def to_row(self) -> tuple:
+        """Convert to a tuple in CSVWriter.OUTPUT_FIELDS column order."""
+        return (
+            self.no,
+            self.image,
+            self.vietnamese,
+            self.suggestion,
+            self.keyword,
+            self.transcription,
+            self.explanation,
+            self.sound,
+            self.example,
+        )
+
 
 class CSVReader:
     """Read input CSV files."""
@@ -62,11 +77,21 @@ class CSVReader:
             raise FileNotFoundError(f"Input file not found: {self.filepath}")
 
         with open(self.filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+
+            if "Keyword" not in header:
+                return
+
+            # Index columns directly instead of building a dict per row
+            keyword_index = header.index("Keyword")
+            vietnamese_index = header.index("Vietnamese") if "Vietnamese" in header else None
 
             for row in reader:
-                keyword = row.get("Keyword", "").strip()
-                vietnamese = row.get("Vietnamese", "").strip()
+                keyword = row[keyword_index].strip() if keyword_index < len(row) else ""
+                vietnamese = ""
+                if vietnamese_index is not None and vietnamese_index < len(row):
+                    vietnamese = row[vietnamese_index].strip()
 
                 if keyword:
                     yield InputWord(keyword=keyword, vietnamese=vietnamese)
@@ -89,32 +114,55 @@ class CSVWriter:
             cards: List of AnkiCard objects to write
         """
         with open(self.filepath, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.OUTPUT_FIELDS)
-            writer.writeheader()
-
-            for card in cards:
-                writer.writerow(card.to_dict())
+            writer = csv.writer(f)
+            writer.writerow(self.OUTPUT_FIELDS)
+            writer.writerows(card.to_row() for card in cards)
 
         print(f"Written {len(cards)} cards to {self.filepath}")
 
-    def append_card(self, card: AnkiCard) -> None:
+    def written_keywords(self) -> set[str]:
+        """
+        Read the keywords of cards already in the output file.
+
+        Returns:
+            Set of "No" values, empty if the file does not exist yet
         """
-        Append a single card to the CSV file.
+        if not self.filepath.exists():
+            return set()
+
+        with open(self.filepath, "r", encoding="utf-8", newline="") as f:
+            return {row["No"] for row in csv.DictReader(f) if row.get("No")}
+
+    @contextmanager
+    def open_stream(self, append: bool = False) -> Iterator[Callable[[AnkiCard], None]]:
+        """
+        Open the CSV file for writing cards one at a time.
 
-        Creates file with header if it doesn't exist.
+        Every card is flushed as soon as it is written, so partial results
+        survive an interrupted run.
 
         Args:
-            card: AnkiCard object to append
+            append: Add to an existing file instead of starting a new one with a header
+
+        Yields:
+            Function that writes a single AnkiCard to the file
         """
-        file_exists = self.filepath.exists()
+        written = 0
+
+        with open(self.filepath, "a" if append else "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            if not append:
+                writer.writerow(self.OUTPUT_FIELDS)
 
-        with open(self.filepath, "a", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.OUTPUT_FIELDS)
+            def write_card(card: AnkiCard) -> None:
+                nonlocal written
+                writer.writerow(card.to_row())
+                f.flush()
+                written += 1
 
-            if not file_exists:
-                writer.writeheader()
+            yield write_card
 
-            writer.writerow(card.to_dict())
+        print(f"Written {written} cards to {self.filepath}")
 
 
 if __name__ == "__main__":
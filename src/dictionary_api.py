@@ -1,9 +1,14 @@
 """Dictionary API client for fetching word definitions and pronunciations."""
 
+import threading
+import diskcache
 import requests
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from typing import Optional
 
+from http_session import create_session
+
 
 @dataclass
 class WordInfo:
@@ -23,27 +28,46 @@ class WordInfo:
 class DictionaryAPIClient:
     """Client for the dictionary API."""
 
-    def __init__(self, base_url: str = "https://dictionary-api.eliaschen.dev"):
+    def __init__(
+        self,
+        base_url: str = "https://dictionary-api.eliaschen.dev",
+        max_concurrent: int = 16,
+        session: requests.Session = None,
+        cache_dir: str = ".cache/dictionary",
+    ):
         self.base_url = base_url.rstrip("/")
+        self.session = session or create_session()
+        self.cache = diskcache.Cache(cache_dir)
+        self._limiter = threading.BoundedSemaphore(max_concurrent)
 
     def get_word_info(self, word: str) -> Optional[WordInfo]:
         """
         Fetch word information from the dictionary API.
 
+        Successful lookups are cached on disk, so re-runs skip the request.
+
         Args:
             word: The English word to look up
 
         Returns:
             WordInfo object with pronunciation, definition, and examples
         """
+        key = f"en:{word}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return WordInfo(**cached)
+
         url = f"{self.base_url}/api/dictionary/en/{word}"
 
         try:
-            response = requests.get(url, timeout=10)
+            with self._limiter:
+                response = self.session.get(url, timeout=10)
             response.raise_for_status()
             data = response.json()
 
-            return self._parse_response(word, data)
+            word_info = self._parse_response(word, data)
+            self.cache[key] = asdict(word_info)
+            return word_info
         except requests.RequestException as e:
             print(f"Error fetching word '{word}': {e}")
             return None
@@ -97,10 +121,7 @@ class DictionaryAPIClient:
         Returns:
             Formatted string like "{{c1::word}} - definition"
         """
-        if not definition:
-            return f"{{{{c1::{word}}}}}"
-
-        return f"{{{{c1::{word}}}}} - {definition}"
+        return format_explanation(word, definition)
 
     def format_examples(self, examples: list[str]) -> str:
         """
@@ -112,10 +133,25 @@ class DictionaryAPIClient:
         Returns:
             Formatted string with bullet points
         """
-        if not examples:
-            return ""
+        return format_examples(tuple(examples))
+
+
+@lru_cache(maxsize=4096)
+def format_explanation(word: str, definition: str) -> str:
+    """Format explanation with cloze syntax, memoized for duplicate words."""
+    if not definition:
+        return f"{{{{c1::{word}}}}}"
+
+    return f"{{{{c1::{word}}}}} - {definition}"
+
+
+@lru_cache(maxsize=4096)
+def format_examples(examples: tuple[str, ...]) -> str:
+    """Format examples as a bullet list, memoized for duplicate words."""
+    if not examples:
+        return ""
 
-        return "<br>".join(f"- {ex}" for ex in examples[:3])
+    return "<br>".join(f"- {ex}" for ex in examples[:3])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+"""Shared HTTP session with connection pooling and retries."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 20, max_retries: int = 3) -> requests.Session:
+    """
+    Create a requests session that keeps connections alive between calls.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept open per host
+        max_retries: Retry attempts for rate limit and gateway errors
+
+    Returns:
+        Configured requests.Session
+    """
+    # Honor Retry-After on 429s, which is usually shorter than the backoff
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
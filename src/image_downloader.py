@@ -1,24 +1,49 @@
 """Download images from Pexels API."""
 
 import os
-import time
+import re
+import shutil
+import threading
+import diskcache
 import requests
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from http_session import create_session
+from media_files import COPY_BUFFER_SIZE, ExistingFiles
+
+
+# Pexels CDN URLs carry resize options in the query string, so match the path only
+EXTENSION_RE = re.compile(r"^[^?#]*\.(jpe?g|png|webp)(?:$|[?#])", re.IGNORECASE)
+EXTENSIONS = {"jpg": ".jpg", "jpeg": ".jpg", "png": ".png", "webp": ".webp"}
 
 
 class PexelsImageDownloader:
     """Download images from Pexels API."""
 
-    def __init__(self, output_dir: str = "output/images", api_key: str = None, suffix: str = "_auto_tool"):
+    def __init__(
+        self,
+        output_dir: str = "output/images",
+        api_key: str = None,
+        suffix: str = "_auto_tool",
+        max_concurrent: int = 4,
+        session: requests.Session = None,
+        cache_dir: str = ".cache/pexels",
+    ):
         load_dotenv()
 
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._existing = ExistingFiles(self.output_dir)
         self.api_key = api_key or os.getenv("PEXELS_API_KEY")
         self.base_url = "https://api.pexels.com/v1"
         self.suffix = suffix
+        self.session = session or create_session()
+        self.cache = diskcache.Cache(cache_dir)
+        # Pexels rate-limits aggressively, so cap in-flight searches across threads
+        self._limiter = threading.BoundedSemaphore(max_concurrent)
 
         if not self.api_key:
             print("Warning: PEXELS_API_KEY not found in environment")
@@ -46,53 +71,43 @@ class PexelsImageDownloader:
 
         return self._download_image(image_url, filename)
 
-    def _search_image(self, keyword: str, max_retries: int = 3, initial_delay: int = 2) -> Optional[str]:
+    def _search_image(self, keyword: str) -> Optional[str]:
         """
         Search Pexels for an image matching the keyword.
 
-        Implements rate limit handling with exponential backoff.
+        Rate limit (429) and server errors are retried with exponential
+        backoff by the session's transport adapter. Found image URLs are
+        cached on disk by keyword.
 
         Args:
             keyword: Search keyword
-            max_retries: Maximum number of retry attempts for rate limit errors
-            initial_delay: Initial delay in seconds before first retry
         """
+        cached = self.cache.get(keyword)
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/search"
         headers = {"Authorization": self.api_key}
         params = {"query": keyword, "per_page": 1, "orientation": "square"}
 
-        for attempt in range(max_retries + 1):
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                photos = data.get("photos", [])
-                if photos:
-                    return photos[0]["src"]["medium"]
-
-                print(f"No images found for keyword: {keyword}")
-                return None
-
-            except requests.HTTPError as e:
-                if e.response.status_code == 429:
-                    if attempt < max_retries:
-                        delay = initial_delay * (2 ** attempt)
-                        print(f"Rate limit hit for '{keyword}'. Waiting {delay}s before retry ({attempt + 1}/{max_retries})...")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        print(f"Rate limit exceeded for '{keyword}' after {max_retries} retries. Skipping.")
-                        return None
-                else:
-                    print(f"HTTP error searching Pexels for '{keyword}': {e}")
-                    return None
-
-            except requests.RequestException as e:
-                print(f"Error searching Pexels for '{keyword}': {e}")
-                return None
-
-        return None
+        try:
+            with self._limiter:
+                response = self.session.get(url, headers=headers, params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+
+            photos = data.get("photos", [])
+            if photos:
+                image_url = photos[0]["src"]["medium"]
+                self.cache[keyword] = image_url
+                return image_url
+
+            print(f"No images found for keyword: {keyword}")
+            return None
+
+        except requests.RequestException as e:
+            print(f"Error searching Pexels for '{keyword}': {e}")
+            return None
 
     def _download_image(self, url: str, filename: str) -> Optional[str]:
         """Download image from URL."""
@@ -100,35 +115,31 @@ class PexelsImageDownloader:
         full_filename = f"{filename}{self.suffix}{ext}"
         filepath = self.output_dir / full_filename
 
-        if filepath.exists():
+        if full_filename in self._existing:
             print(f"Image already exists: {full_filename}")
             return full_filename
 
         try:
-            response = requests.get(url, timeout=30, stream=True)
+            response = self.session.get(url, timeout=30, stream=True)
             response.raise_for_status()
 
+            response.raw.decode_content = True
             with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
 
+            self._existing.add(full_filename)
             print(f"Downloaded image: {full_filename}")
             return full_filename
 
-        except requests.RequestException as e:
+        except (requests.RequestException, Urllib3HTTPError) as e:
             print(f"Error downloading image: {e}")
             return None
 
     def _get_extension(self, url: str) -> str:
         """Extract file extension from URL."""
-        url_lower = url.lower().split("?")[0]
-
-        if url_lower.endswith(".jpg") or url_lower.endswith(".jpeg"):
-            return ".jpg"
-        elif url_lower.endswith(".png"):
-            return ".png"
-        elif url_lower.endswith(".webp"):
-            return ".webp"
+        match = EXTENSION_RE.match(url)
+        if match:
+            return EXTENSIONS[match.group(1).lower()]
         return ".jpg"
 
     def get_filepath(self, filename: str) -> Path:
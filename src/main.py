@@ -2,16 +2,27 @@
 """Main orchestration script for Anki card generation."""
 
 import argparse
+import queue
+import socket
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urlparse
 
 from csv_handler import CSVReader, CSVWriter, AnkiCard
 from dictionary_api import DictionaryAPIClient
+from http_session import create_session
 from sound_downloader import SoundDownloader
 from image_downloader import PexelsImageDownloader
 from translator import Translator
 from suggestion import generate_suggestion_deterministic
 
+# Hosts contacted for every word besides the dictionary API
+MEDIA_HOSTS = ("api.pexels.com", "images.pexels.com", "dictionary.cambridge.org")
+
 
 class AnkiCardGenerator:
     """Generate Anki cards from input CSV."""
@@ -23,38 +34,82 @@ class AnkiCardGenerator:
         sounds_dir: str = "output/sounds",
         images_dir: str = "output/images",
         dictionary_url: str = "https://dictionary-api.eliaschen.dev",
+        workers: int = 8,
+        resume: bool = True,
     ):
+        self.workers = workers
+        self.resume = resume
         self.csv_reader = CSVReader(input_file)
         self.csv_writer = CSVWriter(output_file)
-        self.dictionary = DictionaryAPIClient(dictionary_url)
-        self.sound_downloader = SoundDownloader(sounds_dir)
-        self.image_downloader = PexelsImageDownloader(images_dir)
+        # One pooled session so repeated calls to the same host reuse connections.
+        # Keep at least one idle connection per worker so none are discarded under load.
+        self.session = create_session(pool_maxsize=max(20, workers))
+        self.dictionary = DictionaryAPIClient(dictionary_url, session=self.session)
+        self.sound_downloader = SoundDownloader(sounds_dir, session=self.session)
+        self.image_downloader = PexelsImageDownloader(images_dir, session=self.session)
         self.translator = Translator()
+        threading.Thread(
+            target=self._warm_dns, args=((urlparse(dictionary_url).hostname, *MEDIA_HOSTS),), daemon=True
+        ).start()
 
-    def generate(self) -> list[AnkiCard]:
+    def generate(self) -> int:
         """
         Generate Anki cards from input CSV.
 
+        Words are processed concurrently on a thread pool since the work is
+        dominated by network I/O. Cards keep the order of the input file and
+        are handed to a background writer thread as soon as they are ready.
+
+        When resuming, words that already have a card in the output CSV are
+        skipped and new cards are appended to it.
+
         Returns:
-            List of generated AnkiCard objects
+            Number of newly generated Anki cards
         """
-        cards = []
+        generated = 0
         skipped = []
+        input_words = list(self.csv_reader.read_words())
 
-        for input_word in self.csv_reader.read_words():
-            print(f"\nProcessing: {input_word.keyword}")
+        done = self.csv_writer.written_keywords() if self.resume else set()
+        if done:
+            input_words = [w for w in input_words if w.keyword not in done]
+            print(f"Resuming: {len(done)} cards already in {self.csv_writer.filepath}")
 
-            word_info = self.dictionary.get_word_info(input_word.keyword)
+        # Open the output before any network work so a bad path fails fast
+        with self.csv_writer.open_stream(append=bool(done)) as write_card:
+            translations = self._translate_missing(input_words)
 
-            if not word_info or not word_info.definition:
-                print(f"  -> Skipped (not found in dictionary)")
-                skipped.append(input_word.keyword)
-                continue
+            out_queue: queue.Queue[Optional[AnkiCard]] = queue.Queue()
+            writer_errors: list[Exception] = []
+            writer = threading.Thread(
+                target=self._writer_loop, args=(out_queue, write_card, writer_errors), daemon=True
+            )
+            writer.start()
+
+            try:
+                # Downloads get their own pool so a word's downloads never wait on a free word slot
+                with ThreadPoolExecutor(max_workers=self.workers) as io_pool, ThreadPoolExecutor(
+                    max_workers=self.workers
+                ) as pool:
+                    build_card = partial(self._build_card, translations=translations, io_pool=io_pool)
+                    for input_word, card in zip(input_words, pool.map(build_card, input_words)):
+                        if writer_errors:
+                            # Nothing more can be saved, so don't spend more requests
+                            pool.shutdown(cancel_futures=True)
+                            break
+
+                        if card is None:
+                            skipped.append(input_word.keyword)
+                            continue
 
-            card = self._process_word(input_word, word_info)
-            cards.append(card)
+                        out_queue.put(card)
+                        generated += 1
+            finally:
+                out_queue.put(None)
+                writer.join()
 
-        self.csv_writer.write_cards(cards)
+            if writer_errors:
+                raise writer_errors[0]
 
         if skipped:
             print(f"\n--- Skipped {len(skipped)} phrases (not in dictionary) ---")
@@ -62,7 +117,31 @@ class AnkiCardGenerator:
                 print(f"  - {word}")
             self._write_skipped_log(skipped)
 
-        return cards
+        return generated
+
+    def _warm_dns(self, hosts: tuple[str, ...]) -> None:
+        """Resolve API hosts ahead of the first request so the OS resolver cache is warm."""
+        for host in hosts:
+            if not host:
+                continue
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except OSError:
+                # The real request will report the failure
+                pass
+
+    def _writer_loop(
+        self,
+        out_queue: queue.Queue[Optional[AnkiCard]],
+        write_card: Callable[[AnkiCard], None],
+        errors: list[Exception],
+    ) -> None:
+        """Write cards from the queue until a None sentinel arrives, recording any failure in errors."""
+        try:
+            while (card := out_queue.get()) is not None:
+                write_card(card)
+        except Exception as e:
+            errors.append(e)
 
     def _write_skipped_log(self, skipped: list[str]) -> None:
         """Write skipped words to a log file for manual review."""
@@ -74,19 +153,44 @@ class AnkiCardGenerator:
                 f.write(f"{word}\n")
         print(f"Skipped words saved to: {log_path}")
 
-    def _process_word(self, input_word, word_info) -> AnkiCard:
+    def _translate_missing(self, input_words) -> dict[str, str]:
+        """Translate every keyword that has no Vietnamese meaning in one batch."""
+        missing = list(dict.fromkeys(w.keyword for w in input_words if not w.vietnamese))
+        if not missing:
+            return {}
+
+        print(f"Translating {len(missing)} words to Vietnamese...")
+        vietnamese = self.translator.translate_batch(missing, max_workers=self.workers)
+        return {keyword: vi for keyword, vi in zip(missing, vietnamese) if vi}
+
+    def _build_card(
+        self, input_word, translations: dict[str, str], io_pool: ThreadPoolExecutor
+    ) -> Optional[AnkiCard]:
+        """Look up a word and build its card, or return None if it is not in the dictionary."""
+        print(f"\nProcessing: {input_word.keyword}")
+
+        word_info = self.dictionary.get_word_info(input_word.keyword)
+
+        if not word_info or not word_info.definition:
+            print(f"  -> Skipped '{input_word.keyword}' (not found in dictionary)")
+            return None
+
+        return self._process_word(input_word, word_info, translations, io_pool)
+
+    def _process_word(
+        self, input_word, word_info, translations: dict[str, str], io_pool: ThreadPoolExecutor
+    ) -> AnkiCard:
         """Process a single word and generate an Anki card."""
         keyword = input_word.keyword
-        vietnamese = input_word.vietnamese
+        vietnamese = input_word.vietnamese or translations.get(keyword, "")
 
-        if not vietnamese:
-            vietnamese = self.translator.translate_to_vietnamese(keyword) or ""
-
-        sound_file = ""
+        # Sound and image come from different hosts, so fetch them at the same time
+        sound_future = None
         if word_info.pronunciation_url:
-            sound_file = self.sound_downloader.download(word_info.pronunciation_url, keyword) or ""
+            sound_future = io_pool.submit(self.sound_downloader.download, word_info.pronunciation_url, keyword)
 
         image_file = self.image_downloader.search_and_download(keyword) or ""
+        sound_file = (sound_future.result() if sound_future else None) or ""
 
         suggestion = generate_suggestion_deterministic(keyword)
 
@@ -111,6 +215,14 @@ class AnkiCardGenerator:
         )
 
 
+def positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Generate Anki cards from vocabulary CSV")
@@ -121,6 +233,10 @@ def main():
     parser.add_argument(
         "--dictionary-url", default="https://dictionary-api.eliaschen.dev", help="Dictionary API base URL"
     )
+    parser.add_argument("--workers", type=positive_int, default=8, help="Number of words processed concurrently")
+    parser.add_argument(
+        "--no-resume", action="store_true", help="Regenerate every word instead of skipping those already in the output"
+    )
 
     args = parser.parse_args()
 
@@ -134,11 +250,13 @@ def main():
         sounds_dir=args.sounds_dir,
         images_dir=args.images_dir,
         dictionary_url=args.dictionary_url,
+        workers=args.workers,
+        resume=not args.no_resume,
     )
 
     try:
-        cards = generator.generate()
-        print(f"\nSuccess! Generated {len(cards)} Anki cards.")
+        generated = generator.generate()
+        print(f"\nSuccess! Generated {generated} Anki cards.")
         print(f"Output file: {args.output}")
         print(f"Sound files: {args.sounds_dir}/")
         print(f"Image files: {args.images_dir}/")
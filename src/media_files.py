@@ -0,0 +1,29 @@
+"""Helpers shared by the sound and image downloaders."""
+
+import os
+import sys
+from pathlib import Path
+
+# Pronunciations and thumbnails are small, so most fit in a single read/write
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# The default filesystems on macOS and Windows ignore case in filenames
+CASE_INSENSITIVE_FS = sys.platform in ("darwin", "win32")
+
+
+class ExistingFiles:
+    """Names of files in a directory, listed once instead of stat-ing every candidate."""
+
+    def __init__(self, directory: Path):
+        self._names = {self._key(name) for name in os.listdir(directory)}
+
+    def __contains__(self, filename: str) -> bool:
+        return self._key(filename) in self._names
+
+    def add(self, filename: str) -> None:
+        """Record a file written after the directory was listed."""
+        self._names.add(self._key(filename))
+
+    @staticmethod
+    def _key(filename: str) -> str:
+        return filename.casefold() if CASE_INSENSITIVE_FS else filename
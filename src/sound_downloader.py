@@ -1,9 +1,19 @@
 """Download sound files from URLs."""
 
 import os
+import re
+import shutil
 import requests
 from pathlib import Path
 from typing import Optional
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from http_session import create_session
+from media_files import COPY_BUFFER_SIZE, ExistingFiles
+
+
+# Match only the end of the URL path so an ".mp3" in the query string is ignored
+EXTENSION_RE = re.compile(r"^[^?#]*\.(mp3|wav|ogg)(?:$|[?#])", re.IGNORECASE)
 
 
 class SoundDownloader:
@@ -16,10 +26,12 @@ class SoundDownloader:
         "Referer": "https://dictionary.cambridge.org/",
     }
 
-    def __init__(self, output_dir: str = "output/sounds", suffix: str = "_auto_tool"):
+    def __init__(self, output_dir: str = "output/sounds", suffix: str = "_auto_tool", session: requests.Session = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._existing = ExistingFiles(self.output_dir)
         self.suffix = suffix
+        self.session = session or create_session()
 
     def download(self, url: str, filename: str) -> Optional[str]:
         """
@@ -39,33 +51,31 @@ class SoundDownloader:
         full_filename = f"{filename}{self.suffix}{ext}"
         filepath = self.output_dir / full_filename
 
-        if filepath.exists():
+        if full_filename in self._existing:
             print(f"Sound file already exists: {full_filename}")
             return full_filename
 
         try:
-            response = requests.get(url, headers=self.HEADERS, timeout=30, stream=True)
+            response = self.session.get(url, headers=self.HEADERS, timeout=30, stream=True)
             response.raise_for_status()
 
+            response.raw.decode_content = True
             with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
 
+            self._existing.add(full_filename)
             print(f"Downloaded sound: {full_filename}")
             return full_filename
 
-        except requests.RequestException as e:
+        except (requests.RequestException, Urllib3HTTPError) as e:
             print(f"Error downloading sound from {url}: {e}")
             return None
 
     def _get_extension(self, url: str) -> str:
         """Extract file extension from URL."""
-        if ".mp3" in url.lower():
-            return ".mp3"
-        elif ".wav" in url.lower():
-            return ".wav"
-        elif ".ogg" in url.lower():
-            return ".ogg"
+        match = EXTENSION_RE.match(url)
+        if match:
+            return f".{match.group(1).lower()}"
         return ".mp3"
 
     def get_filepath(self, filename: str) -> Path:
@@ -1,6 +1,7 @@
 """Generate cloze-style suggestion hints for English words."""
 
 import random
+from functools import lru_cache
 
 
 def generate_suggestion(word: str, reveal_count: int = None) -> str:
@@ -46,11 +47,28 @@ def generate_suggestion(word: str, reveal_count: int = None) -> str:
     return " ".join(result)
 
 
+def _reveal_indices(length: int, reveal_count: int) -> tuple[int, ...]:
+    """Evenly spaced positions to reveal, never including the last character."""
+    step = length / (reveal_count + 1)
+    # Shift a reveal of the last character one to the left instead
+    return tuple(min(int(step * (i + 1)), length - 2) for i in range(reveal_count))
+
+
+# Positions for every word length and default reveal count we expect to see
+_REVEAL_INDICES = {
+    (length, reveal_count): _reveal_indices(length, reveal_count)
+    for length in range(3, 65)
+    for reveal_count in (2, 3)
+}
+
+
+@lru_cache(maxsize=4096)
 def generate_suggestion_deterministic(word: str, reveal_count: int = None) -> str:
     """
     Generate a deterministic cloze-style suggestion hint.
 
-    Reveals characters at evenly spaced positions for consistency.
+    Reveals characters at evenly spaced positions for consistency. Results are
+    memoized, so duplicate keywords are computed once.
 
     Args:
         word: The English word to create a hint for
@@ -77,19 +95,21 @@ def generate_suggestion_deterministic(word: str, reveal_count: int = None) -> st
             reveal_count = 3
 
     reveal_count = min(reveal_count, length)
-    step = length / (reveal_count + 1)
-    reveal_indices = set(int(step * (i + 1)) for i in range(reveal_count))
-
-    if length - 1 in reveal_indices:
-        reveal_indices.discard(length - 1)
-        reveal_indices.add(length - 2)
-
-    result = []
-    for i, char in enumerate(word):
-        if i in reveal_indices:
-            result.append(char)
-        else:
-            result.append("_")
+    reveal_indices = _REVEAL_INDICES.get((length, reveal_count))
+    if reveal_indices is None:
+        reveal_indices = _reveal_indices(length, reveal_count)
+
+    if word.isascii():
+        # "_ _ ... _" as bytes: character i sits at offset 2 * i
+        hint = bytearray(b"_ " * length)
+        hint.pop()
+        for i in reveal_indices:
+            hint[i * 2] = ord(word[i])
+        return hint.decode("ascii")
+
+    result = ["_"] * length
+    for i in reveal_indices:
+        result[i] = word[i]
 
     return " ".join(result)
 
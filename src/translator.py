@@ -1,26 +1,91 @@
 """Google Translate fallback for Vietnamese translations."""
 
-from typing import Optional
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import diskcache
 
 
 class Translator:
-    """Translate English words to Vietnamese using deep-translator."""
+    """Translate English words to Vietnamese using deep-translator, falling back to googletrans."""
 
-    def __init__(self):
-        self._translator = None
+    def __init__(self, cache_dir: str = ".cache/translations"):
+        # Until a backend is chosen, the first call picks one and then swaps itself out
+        self._translate_fn: Callable[[str], Optional[str]] = self._init_and_translate
         self._initialized = False
+        self._init_lock = threading.Lock()
+        self._backends = [
+            ("deep-translator", self._init_deep_translator),
+            ("googletrans", self._init_googletrans),
+        ]
+        self.cache = diskcache.Cache(cache_dir)
+
+        # Importing the backend is slow; do it while the caller does other startup work
+        threading.Thread(target=self._init_translator, daemon=True).start()
 
     def _init_translator(self):
-        """Lazy initialization of translator."""
-        if not self._initialized:
-            try:
-                from deep_translator import GoogleTranslator
+        """Pick the first available backend once, safe to call from several threads."""
+        if self._initialized:
+            return
+
+        with self._init_lock:
+            if self._initialized:
+                return
+
+            for name, init_backend in self._backends:
+                try:
+                    self._translate_fn = init_backend()
+                    break
+                except ImportError:
+                    continue
+                except Exception as e:
+                    print(f"Warning: {name} failed to initialize: {e}")
+                    continue
+            else:
+                print("Warning: no translation backend available. Run: pip install deep-translator")
+                self._translate_fn = lambda word: None
+
+            self._initialized = True
+
+    def _init_and_translate(self, word: str) -> Optional[str]:
+        """Resolve the backend on first use, then translate with it."""
+        self._init_translator()
+        return self._translate_fn(word)
+
+    def _init_deep_translator(self) -> Callable[[str], str]:
+        """Create a translate function backed by deep-translator."""
+        from deep_translator import GoogleTranslator
+
+        # GoogleTranslator stores the query text on the instance before sending it,
+        # so concurrent calls on one instance can swap results; give each thread its own
+        local = threading.local()
+
+        def translate(word: str) -> str:
+            if not hasattr(local, "translator"):
+                local.translator = GoogleTranslator(source="en", target="vi")
+            return local.translator.translate(word)
+
+        return translate
+
+    def _init_googletrans(self) -> Callable[[str], str]:
+        """Create a translate function backed by googletrans."""
+        from googletrans import Translator as GoogleTrans
+
+        # googletrans 4.0.1+ only has a coroutine API, which our worker threads can't drive
+        if inspect.iscoroutinefunction(GoogleTrans.translate):
+            raise ImportError("googletrans async API is not supported")
+
+        # The client keeps per-request token state, so don't share it between threads
+        local = threading.local()
+
+        def translate(word: str) -> str:
+            if not hasattr(local, "translator"):
+                local.translator = GoogleTrans()
+            return local.translator.translate(word, src="en", dest="vi").text
 
-                self._translator = GoogleTranslator(source="en", target="vi")
-                self._initialized = True
-            except ImportError:
-                print("Warning: deep-translator not installed. Run: pip install deep-translator")
-                self._initialized = True
+        return translate
 
     def translate_to_vietnamese(self, word: str) -> Optional[str]:
         """
@@ -35,18 +100,42 @@ class Translator:
         if not word:
             return None
 
-        self._init_translator()
-
-        if not self._translator:
-            return None
+        key = f"en-vi:{word}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
-            result = self._translator.translate(word)
+            result = self._translate_fn(word)
+            if result:
+                self.cache[key] = result
             return result
         except Exception as e:
             print(f"Translation error for '{word}': {e}")
             return None
 
+    def translate_batch(self, words: list[str], max_workers: int = 8) -> list[Optional[str]]:
+        """
+        Translate many English words to Vietnamese.
+
+        Requests are fanned out concurrently; neither backend batches
+        several words into one request.
+
+        Args:
+            words: English words to translate
+            max_workers: Maximum number of concurrent translation requests
+
+        Returns:
+            Vietnamese translations in the same order as words (None on failure)
+        """
+        if not words:
+            return []
+
+        self._init_translator()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.translate_to_vietnamese, words))
+
 
 if __name__ == "__main__":
     translator = Translator()